@@ -1,40 +1,102 @@
-import glob
+import mmap
+import os
+from concurrent.futures import ThreadPoolExecutor
 
 import seedir as sd
+from prompt_toolkit import PromptSession
 
 import appl
-from appl import AIRole, gen, ppl, records
+from appl import AIRole, SystemMessage, gen, ppl, records
 from appl.core import load_file
+from appl.utils import get_num_tokens
 
 appl.init()
 
 
+def iter_source_files(root: str, ext: str = ".py"):
+    """Walk the folder recursively, yield files with the extension in sorted order."""
+    stack = [root]
+    while stack:
+        folder = stack.pop()
+        with os.scandir(folder) as it:
+            entries = sorted(it, key=lambda e: e.name)
+        subfolders = []
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                if entry.name != "__pycache__":
+                    subfolders.append(entry.path)
+            elif entry.name.endswith(ext):
+                yield entry.path
+        stack.extend(reversed(subfolders))  # visit subfolders in sorted order
+
+
+def read_file(path: str) -> str:
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        if os.fstat(fd).st_size == 0:  # empty files cannot be mapped
+            return ""
+        with mmap.mmap(fd, 0, access=mmap.ACCESS_READ) as mm:
+            # decode directly from the mapped pages, without an extra bytes copy
+            return str(mm, "utf-8", "replace")
+    finally:
+        os.close(fd)
+
+
+def build_preamble(intro: str, tree: str, source: str, ext: str = ".py") -> str:
+    """Build the static part of the prompt, byte-identical across calls."""
+    lines = [
+        "===== README =====",
+        intro,
+        "===== directory structure =====",
+        "The source code is organized as follows:",
+        tree,
+        "===== source =====",
+        "The contents of the source code are as follows:",
+    ]
+    # reading files is I/O bound, overlap the reads in threads; the reads are
+    # submitted while the folder is still being walked
+    with ThreadPoolExecutor() as executor:
+        for f, content in executor.map(
+            lambda path: (path, read_file(path)), iter_source_files(source, ext)
+        ):
+            lines.append(f"===== {f} =====")
+            lines.append(content)
+    return "\n".join(lines)
+
+
 @ppl
-def chat(intro: str, source: str, ext: str = ".py"):
-    f"===== README ====="
-    intro
-    f"===== directory structure ====="
-    f"The source code is organized as follows:"
-    sd.seedir(source, style="spaces", printout=False, exclude_folders=["__pycache__"])
-    f"===== source ====="
-    f"The contents of the source code are as follows:"
-    for f in glob.glob(source + f"/*{ext}"):
-        f"===== {f} ====="
-        with open(f, "r") as file:
-            file.read()  # put in the prompt
+def chat(intro: str, tree: str, source: str, ext: str = ".py"):
+    preamble = build_preamble(intro, tree, source, ext)
+    # keep the static preamble as its own leading message, so the provider can
+    # reuse its prompt cache for this prefix across turns
+    SystemMessage(preamble)
+    num_tokens = get_num_tokens(preamble)  # counted once, turns are added
+    print(f"The preamble contains {num_tokens} tokens.")
     f"===== chat ====="
     f"Now begin the chat about the project:"
     f""
+    session = PromptSession()  # reuse one session instead of rebuilding per turn
+    # coalesce redraws while a long query is pasted, instead of one per key
+    session.app.min_redraw_interval = 0.05
     while True:
-        print("User:")
-        (query := input())
-        if query.startswith("exit"):
+        query = session.prompt("User: ")
+        if not query.strip():  # skip empty input without calling the model
+            continue
+        if query.strip() == "exit":
             break
+        query  # add the query to the prompt
         print("Assistant:")
         with AIRole():
-            str(gen(stream=True))
+            (reply := str(gen(stream=True)))
+        # only count the new messages instead of the whole conversation
+        num_tokens += get_num_tokens(query) + get_num_tokens(reply)
+        print(f"(about {num_tokens} tokens in the conversation)")
 
 
 if __name__ == "__main__":
     readme = load_file("README.md")
-    chat(readme, "./appl", ".py")
+    # render the directory structure once, outside the prompt function
+    tree = sd.seedir(
+        "./appl", style="spaces", printout=False, exclude_folders=["__pycache__"]
+    )
+    chat(readme, tree, "./appl", ".py")
@@ -186,17 +186,22 @@ def agent_scratchpad():
     return records()
 
 
+# static subsections, prebuilt once like ENV_SETUP below
+AGENT_PROVIDED_INFO = agent_provided_info(compositor=DashList())
+AGENT_SCRATCHPAD = agent_scratchpad()
+
+
 @ppl
 def agent_task_desc(toolkit_descriptions):
     "Task Description"
     with LineSeparated():
         f"Your task is to utilize the provided tools to answer {User}'s questions or help {User} accomplish tasks based on given instructions. You are provided with the following information:"
         ""
-        agent_provided_info(compositor=DashList())
+        AGENT_PROVIDED_INFO
         with LineSeparated(indexing="###"):
             # remove exceptions because they are not needed for the agent
             tool_specification(toolkit_descriptions, include_exception=False)
-            agent_scratchpad()
+            AGENT_SCRATCHPAD
     return records()
 
 
@@ -256,13 +261,19 @@ def agent_task_begin_for_claude(tool_names, inputs, agent_scratchpad):
     return records()
 
 
+# The sections without arguments are static, build their records once at import
+# and reuse them, the records are formatted by the caller's compositor as usual.
+ENV_SETUP = env_setup()
+AGENT_FORMAT_INSTRUCTION = agent_format_instruction()
+
+
 @ppl(comp=LineSeparated(indexing="##"))
 def agent_naive_prompt(
     toolkit_descriptions, tool_names, inputs, agent_scratchpad, is_claude=False
 ):
-    env_setup()
+    ENV_SETUP
     agent_task_desc(toolkit_descriptions)
-    agent_format_instruction()
+    AGENT_FORMAT_INSTRUCTION
     if is_claude:
         task_begin = agent_task_begin_for_claude
     else:
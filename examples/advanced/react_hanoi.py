@@ -62,19 +62,14 @@ class TowerOfHanoi:
             bool: True if the move was successful, False otherwise.
         """
         # Check if move is valid
-        if (
-            from_peg == to_peg
-            or from_peg < 0
-            or from_peg > 2
-            or to_peg < 0
-            or to_peg > 2
-            or not self.pegs[from_peg]
-            or (self.pegs[to_peg] and self.pegs[from_peg][-1] > self.pegs[to_peg][-1])
-        ):
+        if not (0 <= from_peg <= 2 and 0 <= to_peg <= 2) or from_peg == to_peg:
+            return False
+        source, target = self.pegs[from_peg], self.pegs[to_peg]  # index once
+        if not source or (target and source[-1] > target[-1]):
             return False
 
         # Move the disk
-        self.pegs[to_peg].append(self.pegs[from_peg].pop())
+        target.append(source.pop())
         return True
 
     def is_solved(self) -> bool:
@@ -90,10 +85,9 @@ class TowerOfHanoi:
         """
         Render the current state of the pegs and disks.
         """
-        s = ""
-        for i, peg in enumerate(self.pegs):
-            s += f"Peg {i}: " + " ".join(str(disk) for disk in peg) + "\n"
-        return s
+        return "".join(
+            f"Peg {i}: {' '.join(map(str, peg))}\n" for i, peg in enumerate(self.pegs)
+        )
 
 
 def move_disk(env: TowerOfHanoi, from_peg: int, to_peg: int) -> str:
@@ -1,4 +1,7 @@
+import re
 import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 import appl
 from appl import gen, ppl
@@ -6,16 +9,22 @@ from appl import gen, ppl
 appl.init()
 
 
+# match the last "The answer is [ANS]." in the text, compiled once
+ANSWER_PATTERN = re.compile(r".*The answer is ([^.]*)", re.DOTALL)
+
+
 def parse_answer(answer: str):
     # parse the ANS from: The answer is [ANS].
-    if (key := "The answer is ") in answer:
-        return answer.split(key)[-1].split(".")[0].strip()
+    if match := ANSWER_PATTERN.match(answer):
+        return match.group(1).strip()
     return None
 
 
 def get_mode(answers: list[str]):
     """Get the mode of the answers"""
-    return max(set(answers), key=answers.count)
+    if not answers:
+        return None
+    return Counter(answers).most_common(1)[0][0]  # count in a single pass
 
 
 def marginalize(results: list):
@@ -26,12 +35,29 @@ def marginalize(results: list):
     return get_mode(answers)
 
 
+def marginalize_early(results: list):
+    """Count the answers as they complete, return once a majority is reached"""
+    counter = Counter()
+    # wait for the results in a shared pool, so they can be collected out of order
+    executor = ThreadPoolExecutor(max_workers=max(1, len(results)))
+    try:
+        futures = [executor.submit(lambda r: parse_answer(str(r)), r) for r in results]
+        for future in as_completed(futures):
+            counter[future.result()] += 1
+            answer, count = counter.most_common(1)[0]
+            if count > len(results) // 2:
+                return answer  # the remaining results cannot change the mode
+    finally:
+        executor.shutdown(wait=False)  # not waiting for the remaining results
+    return counter.most_common(1)[0][0] if counter else None
+
+
 @ppl
 def cot_consistency(cot_examples: list[str], question: str, num_trials: int):
     cot_examples  # the list of examples are captured into prompt one-by-one
     question
     results = [gen() for _ in range(num_trials)]  # concurrent generation
-    return marginalize(results)  # marginalize the reasoning paths to get the answer
+    return marginalize_early(results)  # stop waiting once the majority agrees
 
 
 @ppl
@@ -59,9 +85,11 @@ question = (
 
 
 n = 5
+# NOTE: the parallel version returns once a majority agrees, without waiting for
+# the remaining samples, while the sequential version always waits for all of them
 start_time = time.time()
 print(f"Parallel CoT-SC Answer: {cot_consistency(cot_examples, question, n)}")
-print(f"Parallel CoT-SC takes {time.time() - start_time:.2f} seconds")
+print(f"Parallel CoT-SC (with early exit) takes {time.time() - start_time:.2f} seconds")
 
 start_time = time.time()
 print(
@@ -1,5 +1,3 @@
-import sympy
-
 import appl
 from appl import AIMessage, Generation, gen, ppl, records
 
@@ -15,6 +13,8 @@ def is_lucky(x: int) -> bool:
     Returns:
         bool: True if the number is a lucky number, False otherwise.
     """
+    import sympy  # imported on first use, sympy is slow to import
+
     return sympy.isprime(x + 3)
 
 
@@ -30,7 +30,8 @@ def func(x):
 
     if actions.is_tool_call:  # LLM choose to call the tool
         # Run the tool calls and store the resulted ToolMessages into the prompt
-        (results := actions.run_tool_calls())  # results is a list of ToolMessage
+        # parallel=True runs independent tool calls concurrently in threads
+        (results := actions.run_tool_calls(parallel=True))  # a list of ToolMessage
         # results[0].content contains the result of the first tool call
 
         # Let LLM generate the text answer while providing the tool information
@@ -30,7 +30,14 @@ def add4(a, b):
     return gen("srt-llama2")
 
 
+def add_all(a, b):
+    # gen returns a future, so all four requests are sent before waiting for any
+    results = [add(a, b) for add in (add1, add2, add3, add4)]
+    return [str(res) for res in results]
+
+
 # print(add1("one", "two"))
 # print(add2("three", "four"))
 # print(add3("five", "six"))
 # print(add4("seven", "eight"))
+# print(add_all("one", "two"))
@@ -1,8 +1,11 @@
 # https://jxnl.github.io/instructor/why/?h=iterable#partial-extraction
+import time
 from typing import List
 
 from instructor import OpenAISchema, Partial
 from rich.console import Console
+from rich.live import Live
+from rich.pretty import Pretty
 
 import appl
 from appl import Generation, gen, ppl
@@ -28,7 +31,13 @@ def extract_info() -> Generation:
 
 console = Console()
 
-for extraction in extract_info():
-    obj = extraction.model_dump()
-    console.clear()
-    console.print(obj)
+# update the partial result in place instead of clearing the whole screen,
+# and refresh at most every 50ms rather than once per streamed chunk
+with Live(console=console, auto_refresh=False) as live:
+    obj, last_refresh = None, 0.0
+    for extraction in extract_info():
+        obj = extraction.model_dump()
+        if time.monotonic() - last_refresh > 0.05:
+            live.update(Pretty(obj), refresh=True)
+            last_refresh = time.monotonic()
+    live.update(Pretty(obj), refresh=True)  # always show the final result
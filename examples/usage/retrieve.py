@@ -1,4 +1,4 @@
-import wikipediaapi
+import functools
 
 import appl
 from appl import as_str, call, gen, ppl, records
@@ -8,8 +8,17 @@ appl.init()
 gen = appl.partial(gen, max_tokens=50, temperature=0.7)
 
 
+@functools.lru_cache(maxsize=1)
+def get_wiki():
+    """Create the client on first use, its HTTP session is reused across queries."""
+    import wikipediaapi
+
+    return wikipediaapi.Wikipedia(user_agent="APPL/0.1", language="en")
+
+
+@functools.lru_cache(maxsize=1024)  # repeated topics skip the request
 def wikipedia(topic: str):
-    wiki = wikipediaapi.Wikipedia(user_agent="APPL/0.1", language="en")
+    wiki = get_wiki()
     page = wiki.page(topic)
     return wiki.extracts(page, exsentences=1)
 
@@ -3,15 +3,10 @@
 from __future__ import annotations
 
 import datetime
-import inspect
 import os
 import sys
 from importlib.metadata import version
 
-import pendulum
-import toml
-import yaml
-from dotenv import load_dotenv
 from loguru import logger
 
 logger.remove()  # Remove default handler
@@ -84,6 +79,14 @@ logger.add(sys.stderr, level="INFO", format=_get_loguru_format())  # default
 global_vars.initialized = False
 
 
+def _format_path(path_format: str, basename: str, time: datetime.datetime) -> str:
+    """Fill the basename and time into a path format, e.g. `{time:YYYY_MM_DD}`."""
+    # the time in path formats uses pendulum's tokens, only import it when needed
+    import pendulum
+
+    return path_format.format(basename=basename, time=pendulum.instance(time))
+
+
 def init(
     resume_cache: Optional[str] = None,
     update_config_hook: Optional[Callable] = None,
@@ -94,18 +97,29 @@ def init(
         resume_cache: Path to the trace file used as resume cache. Defaults to None.
         update_config_hook: A hook to update the configs. Defaults to None.
     """
+    # only initialize once. The flag is only ever set from False to True, so
+    # the unlocked read can only miss a concurrent init, which is then caught
+    # by the second check under the lock.
+    if global_vars.initialized:
+        logger.warning("APPL has already been initialized, ignore")
+        return
     with global_vars.lock:
-        # only initialize once
         if global_vars.initialized:
             logger.warning("APPL has already been initialized, ignore")
             return
         global_vars.initialized = True
 
-    now = pendulum.instance(datetime.datetime.now())
+    # imported here since it is only needed by init, keep `import appl` light
+    from dotenv import dotenv_values
+
+    now = datetime.datetime.now()
     # Get the previous frame in the stack, i.e., the one calling this function
-    frame = inspect.currentframe()
-    if frame and frame.f_back:
-        caller_path = frame.f_back.f_code.co_filename  # Get file_path of the caller
+    try:
+        caller_frame = sys._getframe(1)
+    except ValueError:  # no caller, e.g. called from the outermost frame
+        caller_frame = None
+    if caller_frame is not None:
+        caller_path = caller_frame.f_code.co_filename  # Get file_path of the caller
         caller_basename = os.path.basename(caller_path).split(".")[0]
         caller_folder = os.path.dirname(caller_path)  # Get folder of the caller
         caller_folder = get_folder(caller_folder)
@@ -114,14 +128,18 @@ def init(
             caller_folder, ["appl.yaml", "appl.yml", "appl.json", "appl.toml"]
         )
         # load dotenvs and appl configs from outer to inner with override
-        for dotenv in dotenvs[::-1]:
-            load_dotenv(dotenv, override=True)
-            logger.info("Loaded dotenv from {}".format(dotenv))
-        for config_file in appl_config_files[::-1]:
+        for dotenv in reversed(dotenvs):
+            # parse the file once and set the variables in a single update,
+            # variables without a value are skipped as in load_dotenv
+            values = dotenv_values(dotenv)
+            os.environ.update({k: v for k, v in values.items() if v is not None})
+            logger.info("Loaded dotenv from {}", dotenv)
+        for config_file in reversed(appl_config_files):
             override_configs = load_config(config_file)
-            logger.info("Loaded configs from {}".format(config_file))
+            logger.info("Loaded configs from {}", config_file)
             configs.update(override_configs)
-            logger.info(f"update configs:\n{yaml.dump(override_configs.to_dict())}")
+            # dumped only if the record is emitted
+            logger.opt(lazy=True).info("update configs:\n{}", override_configs.to_yaml)
     else:
         caller_basename, dotenvs, appl_config_files = "appl", [], []
         logger.error(
@@ -130,6 +148,7 @@ def init(
 
     if update_config_hook:
         update_config_hook(configs)
+    # the dotted keys fall back to the default configs when a setting is missing
     log_format = configs.getattrs("settings.logging.format")
     log_level = configs.getattrs("settings.logging.log_level")
     log_file = configs.getattrs("settings.logging.log_file")
@@ -138,34 +157,40 @@ def init(
     logger.add(sys.stderr, level=log_level, format=_get_loguru_format())
     if log_file.get("enabled", False):
         if (log_file_format := log_file.get("path_format", None)) is not None:
-            log_file_path = (
-                f"{log_file_format.format(basename=caller_basename, time=now)}.log"
-            )
+            log_file_path = f"{_format_path(log_file_format, caller_basename, now)}.log"
             log_file.path = log_file_path
             file_log_level = log_file.get("log_level", None) or log_level
-            logger.info(f"Logging to file: {log_file_path} with level {file_log_level}")
+            logger.info(
+                "Logging to file: {} with level {}", log_file_path, file_log_level
+            )
             # no need to overwrite the default format when writing to file
-            logger.add(log_file_path, level=file_log_level, format=log_format)
+            logger.add(
+                log_file_path,
+                level=file_log_level,
+                format=log_format,
+                # write in a background thread, not blocking the caller
+                enqueue=log_file.get("enqueue", True),
+            )
 
     configs["info"] = Configs(
         {
-            "start_time": now.format("YYYY-MM-DD HH:mm:ss"),
+            "start_time": now.strftime("%Y-%m-%d %H:%M:%S"),
             "dotenvs": dotenvs,
             "appl_configs": appl_config_files,
         }
     )
     if configs.getattrs("settings.logging.display.configs"):
-        logger.info(f"Using configs:\n{yaml.dump(configs.to_dict())}")
+        logger.opt(lazy=True).info("Using configs:\n{}", configs.to_yaml)
 
     tracing = configs.getattrs("settings.tracing")
     strict_match = tracing.get("strict_match", True)
     if tracing.get("enabled", False):
         if (trace_file_format := tracing.get("path_format", None)) is not None:
-            prefix = trace_file_format.format(basename=caller_basename, time=now)
+            prefix = _format_path(trace_file_format, caller_basename, now)
             trace_file_path = f"{prefix}.pkl"
             meta_file = f"{prefix}_meta.json"
             tracing.trace_file = trace_file_path
-            logger.info(f"Tracing file: {trace_file_path}")
+            logger.info("Tracing file: {}", trace_file_path)
             dump_file(configs.to_dict(), meta_file)
             global_vars.trace_engine = TraceEngine(
                 trace_file_path, mode="write", strict=strict_match
@@ -176,7 +201,7 @@ def init(
     resume_cache = resume_cache or os.environ.get("APPL_RESUME_TRACE", None)
     if resume_cache:
         global_vars.resume_cache = resume_cache
-        logger.info(f"Using resume cache: {resume_cache}")
+        logger.info("Using resume cache: {}", resume_cache)
         global_vars.resume_cache = TraceEngine(
             resume_cache, mode="read", strict=strict_match
         )
@@ -1,24 +1,28 @@
+import functools
 import os
 
 import addict
 import yaml
 
-from .io import get_ext, load_file
+from .io import YamlDumper, get_ext, load_file
 from .types import *
 
 DIR = os.path.dirname(os.path.abspath(__file__))
 DEFAULT_CONFIG_FILE = os.path.join(DIR, "..", "default_configs.yaml")
 
 
+@functools.lru_cache(maxsize=256)
+def _split_key(key: str) -> Tuple[str, ...]:
+    # the keys are mostly constants in the code, split each of them only once
+    return tuple(key.split("."))
+
+
 class Configs(addict.Dict):
     """A Dictionary class that allows for dot notation access to nested dictionaries."""
 
     def getattrs(self, key: str, default: Any = None) -> Any:
         """Get a value from a nested dictionary using a dot-separated key string."""
-        if "." in key:
-            keys = key.split(".")
-        else:
-            keys = [key]
+        keys = _split_key(key)
         prefix = "."
         v = self
         try:
@@ -44,7 +48,7 @@ class Configs(addict.Dict):
 
     def to_yaml(self) -> str:
         """Convert the Configs object to a YAML string."""
-        return yaml.dump(self.to_dict())
+        return yaml.dump(self.to_dict(), Dumper=YamlDumper)
 
     def __missing__(self, key: str) -> None:
         raise KeyError(key)
@@ -1,12 +1,25 @@
+import functools
 import json
+import math
 import os
 
 import addict
-import toml
 import yaml
 
 from .types import *
 
+try:  # use the libyaml bindings when available, much faster than pure python
+    from yaml import CDumper as YamlDumper
+    from yaml import CSafeLoader as YamlLoader
+except ImportError:  # pragma: no cover
+    from yaml import Dumper as YamlDumper  # type: ignore
+    from yaml import SafeLoader as YamlLoader  # type: ignore
+
+try:  # optional, a faster json encoder
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None  # type: ignore
+
 # from importlib import import_module # read python
 PLAIN_TEXT_FILES = [".txt", ".log", ".md", ".html"]
 
@@ -22,6 +35,30 @@ def get_ext(file: str) -> str:
     return os.path.splitext(file)[1]
 
 
+def _has_non_finite(data: Any) -> bool:
+    """Whether the data contains NaN or infinity, which orjson writes as null."""
+    if isinstance(data, float):
+        return not math.isfinite(data)
+    if isinstance(data, dict):
+        return any(_has_non_finite(v) for v in data.values())
+    if isinstance(data, (list, tuple)):
+        return any(_has_non_finite(v) for v in data)
+    return False
+
+
+def _orjson_dump(data: Any, f: Any) -> None:
+    if _has_non_finite(data):  # keep NaN and Infinity as json.dump writes them
+        json.dump(data, f)
+        return
+    try:
+        content = orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS).decode()
+        f.write(content)  # encoded as a whole, nothing is written if it fails
+    except (orjson.JSONEncodeError, UnicodeEncodeError):
+        # e.g. integers out of 64-bit range, or non-ascii text in a file
+        # not opened as utf-8, the standard encoder handles both
+        json.dump(data, f)
+
+
 def dump_file(
     data: Any,
     file: str,
@@ -39,9 +76,13 @@ def dump_file(
 
     if file_type == ".json":
         dump_func: Callable = json.dump
+        if orjson is not None and not args and not kwargs:
+            dump_func = _orjson_dump  # no custom options, use the fast path
     elif file_type in [".yaml", ".yml"]:
-        dump_func = yaml.dump
+        dump_func = functools.partial(yaml.dump, Dumper=YamlDumper)
     elif file_type == ".toml":
+        import toml  # rarely used, not imported with the package
+
         dump_func = toml.dump
     elif file_type in PLAIN_TEXT_FILES:
 
@@ -67,8 +108,10 @@ def load_file(
     if file_type == ".json":
         load_func: Callable = json.load
     elif file_type in [".yaml", ".yml"]:
-        load_func = yaml.safe_load
+        load_func = functools.partial(yaml.load, Loader=YamlLoader)
     elif file_type == ".toml":
+        import toml
+
         load_func = toml.load
     # elif file_type == ".py":
     #     load_func = import_module
@@ -300,7 +300,12 @@ class Conversation(BaseModel):
 
     def materialize(self) -> None:
         """Materialize the messages in the conversation."""
-        str(self)
+        self.collapse()
+        # materialize each message in place, without joining the whole conversation
+        for sys_m in self.system_messages:
+            sys_m.get_content()
+        for m in self.messages:
+            m.get_content()
 
     def __repr__(self) -> str:
         return f"Conversation({self.system_messages}, {self.messages})"
@@ -1,3 +1,5 @@
+import sys
+import threading
 import time
 
 from litellm import (
@@ -142,11 +144,34 @@ class CompletionResponse(BaseModel):
             self.response_obj = chunk.model_dump()
         else:
             print("===== APPL BEGIN STREAMING =====", flush=True)
+            # flush the stdout once per interval in a single background thread
+            # instead of per chunk, text is shown within an interval even if the
+            # stream pauses. The lock keeps the flushes apart from the writes.
+            interval = configs.getattrs(
+                "settings.logging.display.stream_flush_interval"
+            )
+            lock = threading.Lock()
+            stop = threading.Event()
+
+            def flush_periodically() -> None:
+                while not stop.wait(interval):
+                    with lock:
+                        sys.stdout.flush()
+
+            flusher = threading.Thread(target=flush_periodically, daemon=True)
+            if display:  # nothing is printed otherwise
+                flusher.start()
             suffix = ""
-            for chunk in iter(self):
-                if not display:
-                    continue
-                suffix = self._print_chunk(chunk, suffix)
+            try:
+                for chunk in iter(self):
+                    if not display:
+                        continue
+                    with lock:
+                        suffix = self._print_chunk(chunk, suffix)
+            finally:
+                stop.set()
+                if flusher.is_alive():
+                    flusher.join()
             print(suffix, flush=True)
             print("===== APPL END STREAMING =====", flush=True)
         return self
@@ -166,23 +191,23 @@ class CompletionResponse(BaseModel):
     ) -> str:
         delta: Union[Delta, ChoiceDelta] = chunk.choices[0].delta
 
-        def flush(content: str) -> None:
-            print(content, end="", flush=True)
+        def write(content: str) -> None:
+            print(content, end="")  # flushed periodically by the caller
 
         if delta is not None:
             if delta.content is not None:
-                flush(delta.content)
+                write(delta.content)
             elif getattr(delta, "tool_calls", None):
                 f: Union[Function, ChoiceDeltaToolCallFunction] = delta.tool_calls[
                     0
                 ].function  # type: ignore
                 if f.name is not None:
                     if suffix:
-                        flush(f"{suffix}, ")
-                    flush(f"{f.name}(")
+                        write(f"{suffix}, ")
+                    write(f"{f.name}(")
                     suffix = ")"
                 if f.arguments is not None:
-                    flush(f.arguments)
+                    write(f.arguments)
         return suffix
 
     def _finish(self, response: Any) -> None:
@@ -1,3 +1,4 @@
+import functools
 import inspect
 import json
 import time
@@ -14,6 +15,12 @@ from .types import *
 from .types import override
 
 
+@functools.lru_cache(maxsize=128)
+def _dump_schema(model: Type[BaseModel]) -> str:
+    """Dump the JSON schema of a response model, reused across calls."""
+    return json.dumps(model.model_json_schema(), indent=4)
+
+
 def _update_cost(name: str, cost: float, currency: str = "USD") -> None:
     num_requests = inc_global(f"{name}_num_requests")
     total_cost = inc_global(f"{name}_api_cost", cost)
@@ -141,13 +148,12 @@ class BaseServer(ABC):
                 self.model_name, results.cost, getattr(self, "_cost_currency", "USD")
             )
 
-        dump_args = create_args.copy()
-        if "response_model" in dump_args:
-            v = dump_args["response_model"]
+        # create_args is not used afterwards, only copy it when it needs changes
+        dump_args = create_args
+        if "response_model" in create_args:
+            v = create_args["response_model"]
             if issubclass(v, BaseModel):
-                dump_args["response_model"] = json.dumps(
-                    v.model_json_schema(), indent=4
-                )
+                dump_args = {**create_args, "response_model": _dump_schema(v)}
 
         def trace_gen_response(response: CompletionResponse) -> None:
             add_to_trace(
@@ -43,12 +43,8 @@ class CallFuture(FutureValue):
             **kwargs: The keyword arguments of the function.
         """
         # TODO: maybe use a global executor from the config
-        self._executor = (
-            ProcessPoolExecutor(max_workers=1)
-            if use_process
-            else ThreadPoolExecutor(max_workers=1)
-        )
-        self._submit_fn = lambda: self._executor.submit(func, *args, **kwargs)
+        self._use_process = use_process
+        self._submit_fn = lambda executor: executor.submit(func, *args, **kwargs)
         self._submitted = False
         self._info = func.__name__
         # self._debug = False
@@ -65,7 +61,14 @@ class CallFuture(FutureValue):
 
     def _submit(self) -> None:
         if not self._submitted:
-            self._future: Future = self._submit_fn()
+            # create the executor only when the call is submitted, lazy calls
+            # that are never needed do not create one
+            self._executor = (
+                ProcessPoolExecutor(max_workers=1)
+                if self._use_process
+                else ThreadPoolExecutor(max_workers=1)
+            )
+            self._future: Future = self._submit_fn(self._executor)
             self._submitted = True
 
     @property
@@ -3,7 +3,6 @@ import sys
 
 import loguru
 import tiktoken
-from dotenv.main import _walk_to_root
 
 from .core.config import configs
 from .types import *
@@ -42,6 +41,21 @@ def get_folder(
     return folder
 
 
+def _walk_to_root(path: str) -> Iterator[str]:
+    """Yield the folder and its parent folders up to the root."""
+    if not os.path.exists(path):
+        raise IOError("Starting path not found")
+    if os.path.isfile(path):
+        path = os.path.dirname(path)
+    current_dir = os.path.abspath(path)
+    while True:
+        yield current_dir
+        parent_dir = os.path.dirname(current_dir)
+        if parent_dir == current_dir:
+            break
+        current_dir = parent_dir
+
+
 def find_files(folder: str, filenames: list[str]) -> list[str]:
     """Find files in the folder or its parent folders."""
     results = []
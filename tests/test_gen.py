@@ -3,7 +3,8 @@ from typing import List
 import pytest
 
 import appl
-from appl import AIRole, PromptRecords, SystemMessage, gen, ppl, records
+from appl import AIRole, Configs, PromptRecords, SystemMessage, gen, ppl, records
+from appl.core.config import configs
 
 
 def test_gen():
@@ -62,3 +63,18 @@ def test_gen_error():
 
     error_msg = str(excinfo.value)
     assert "PromptContext" in error_msg or "appl.init" in error_msg
+
+
+def test_gen_partial_display_configs(monkeypatch):
+    appl.init()
+    # the missing display settings fall back to the default configs
+    monkeypatch.setattr(
+        configs.settings.logging, "display", Configs({"llm_cache": True})
+    )
+
+    @ppl
+    def func():
+        "Hello"
+        return gen(mock_response="World")
+
+    assert str(func()) == "World"
@@ -0,0 +1,23 @@
+import json
+
+from appl.core.io import _orjson_dump, dump_file, load_file
+
+
+def test_dump_json_fallbacks(tmp_path):
+    file = str(tmp_path / "data.json")
+
+    # NaN and infinity are written as json.dump does, not as null
+    data = {"a": float("nan"), "b": [1.0, float("inf")], "c": {"d": -float("inf")}}
+    dump_file(data, file)
+    with open(file) as f:
+        assert f.read() == json.dumps(data)
+
+    # integers out of the 64-bit range
+    data = {"a": 2**70}
+    dump_file(data, file)
+    assert load_file(file) == data
+
+    # non-ascii text in a file not opened as utf-8
+    with open(file, "w", encoding="ascii") as f:
+        _orjson_dump({"a": "héllo"}, f)
+    assert load_file(file) == {"a": "héllo"}
@@ -0,0 +1,62 @@
+import sys
+import time
+
+from litellm import ModelResponse
+
+from appl.core.config import configs
+from appl.core.response import CompletionResponse
+
+
+class _FakeStdout:
+    def __init__(self):
+        self.pending = ""
+        self.flushed = ""
+
+    def write(self, s: str) -> int:
+        self.pending += s
+        return len(s)
+
+    def flush(self) -> None:
+        self.flushed += self.pending
+        self.pending = ""
+
+
+def _chunk(content: str, finish: bool = False) -> ModelResponse:
+    return ModelResponse(
+        stream=True,
+        model="gpt-3.5-turbo",
+        choices=[
+            {
+                "index": 0,
+                "delta": {"role": "assistant", "content": content},
+                "finish_reason": "stop" if finish else None,
+            }
+        ],
+    )
+
+
+def test_streaming_flush_on_pause(monkeypatch):
+    interval = 0.05
+    monkeypatch.setattr(
+        configs.settings.logging.display, "stream_flush_interval", interval
+    )
+    stdout = _FakeStdout()
+    monkeypatch.setattr(sys, "stdout", stdout)
+    flushed_in_pause = []
+
+    def paced_stream():
+        yield _chunk("Hello")
+        time.sleep(interval / 10)
+        yield _chunk(" world")  # within the interval, not flushed at once
+        time.sleep(interval * 5)  # the stream pauses
+        flushed_in_pause.append(stdout.flushed)
+        yield _chunk("!", finish=True)
+
+    response = CompletionResponse(raw_response=paced_stream())
+    # drive the plain generator as a stream
+    response.is_stream, response.is_finished = True, False
+    response.streaming()
+
+    assert flushed_in_pause[0].endswith("Hello world")
+    assert "Hello world!" in stdout.flushed
+    assert response.message == "Hello world!"
@@ -0,0 +1,34 @@
+from appl.utils import find_files
+
+
+def test_find_files(tmp_path):
+    inner = tmp_path / "a" / "b"
+    inner.mkdir(parents=True)
+    (tmp_path / "appl.yaml").write_text("")
+    (tmp_path / "appl.json").write_text("")
+    (inner / "appl.json").write_text("")
+    (tmp_path / "a" / "appl.yml").mkdir()  # folders are not matched
+
+    filenames = ["appl.yaml", "appl.yml", "appl.json"]
+    files = find_files(str(inner), filenames)
+    # from inner to outer, the first matched name in each folder
+    assert files[:2] == [str(inner / "appl.json"), str(tmp_path / "appl.yaml")]
+
+    # files added later are found by the next search
+    (tmp_path / "a" / "appl.json").write_text("")
+    assert find_files(str(inner), filenames)[:3] == [
+        str(inner / "appl.json"),
+        str(tmp_path / "a" / "appl.json"),
+        str(tmp_path / "appl.yaml"),
+    ]
+
+
+def test_find_files_relative_folder(tmp_path, monkeypatch):
+    for name in ["a", "b"]:
+        (tmp_path / name / "sub").mkdir(parents=True)
+        (tmp_path / name / "sub" / ".env").write_text("")
+    monkeypatch.chdir(tmp_path / "a")
+    assert find_files("sub", [".env"])[0] == str(tmp_path / "a" / "sub" / ".env")
+    # the same relative folder in another working directory
+    monkeypatch.chdir(tmp_path / "b")
+    assert find_files("sub", [".env"])[0] == str(tmp_path / "b" / "sub" / ".env")